@@ -1,6 +1,6 @@
 import requests
-import json
 import os
+import pathlib
 import sys
 
 #gets the config file from the parent directory 
@@ -8,24 +8,25 @@ current = os.path.dirname(os.path.realpath(__file__))
 parent = os.path.dirname(current)
 sys.path.append(parent)
 import config
+from functions import json_loads
 
-#sets the url for authentication
-url = config.aspacebaseurl + "/users/" + config.username + "/login?password=" + config.password
+#sets the url for authentication, the password is sent in the request body so it stays out of server and proxy logs
+url = config.aspacebaseurl + "/users/" + config.username + "/login"
 
-payload = ""
-headers = {
-  'Content-Type': 'application/json'
+payload = {
+  'password': config.password
 }
 
-response = requests.request("POST", url, headers=headers, data=payload)
+with requests.Session() as s:
+  response = s.post(url, data=payload)
 
 #print(response.text)
-y = json.loads(response.text)
+y = json_loads(response.content)
 
-print(y["session"])
-print("Type 'python 01_reorder_tool/reorder.py' to run the one by one tool or 'python 01_reorder_tool/reorder_multiple.py' to run the all at once tool.  DON'T FORGET: update input.csv before you run either tool.")
+#only the export command goes to stdout so the session can be loaded with eval "$(python 00_set_aspace_session/aspace_session.py)", everything else goes to stderr
+print(y["session"], file=sys.stderr)
+print("Type 'python 01_reorder_tool/reorder.py' to run the one by one tool or 'python 01_reorder_tool/reorder_multiple.py' to run the all at once tool.  DON'T FORGET: update input.csv before you run either tool.", file=sys.stderr)
+print(f"export AS_SESSION_TOKEN={y['session']}")
 
 #records the session token for use in other tools
-with open ('current_sess.txt', 'w') as c:
-  c.write(y["session"])
-  c.close()
\ No newline at end of file
+pathlib.Path('current_sess.txt').write_text(y["session"])
\ No newline at end of file
@@ -1,3 +1,4 @@
+import argparse
 import requests
 import json
 import os
@@ -16,32 +17,55 @@ parent = os.path.dirname(current)
 sys.path.append(parent)
 from config import aspacebaseurl
 from functions import get_record_info
+from functions import get_session_token
 from functions import movObj
 
+#Optional arguments so the tool can run without prompting
+arg_parser = argparse.ArgumentParser()
+arg_parser.add_argument("--parent-type", choices=["archival_objects", "resources"], help="type of the parent record to reorder into")
+arg_parser.add_argument("--parent-id", type=int, help="id of the parent record to reorder into")
+arg_parser.add_argument("--input-csv", default="01_reorder_tool/in/input.csv", help="path to the edited bulk reorder csv")
+args = arg_parser.parse_args()
+
 #get the current session token
-s = open('current_sess.txt', 'r')
-c = s.read()
+c = get_session_token()
 
-parent_id = get_record_info()
+parent_id = get_record_info(args.parent_type, args.parent_id)
 
 print (f"{parent_id} is being updated.")
 
 #Open the input csv
-with open('01_reorder_tool/in/input.csv', 'r', encoding='utf8') as input_file:
-    csv_reader = csv.DictReader(input_file, delimiter=',')
-    for row_number, row in enumerate(csv_reader, start=0):
-        print(f"Archival object {row['Id']} moving to position {row_number} under {parent_id[0]} {parent_id[1]}")
+#utf-8-sig also reads Excel's "CSV UTF-8" exports, which start with a BOM
+with open(args.input_csv, 'r', encoding='utf-8-sig', newline='') as input_file:
+    csv_reader = csv.reader(input_file, delimiter=',')
+    header = next(csv_reader, [])
+    if 'Id' not in header:
+        sys.exit(f"No Id column found in {args.input_csv}")
+    id_col = header.index('Id')
+    row_number = 0
+    #Line numbers start at 2 because line 1 is the header
+    for line_number, row in enumerate(csv_reader, start=2):
+        #Blank rows are skipped so they don't take up a position
+        if not row:
+            continue
+        #Rows too short to have an Id are logged and skipped so the rest of the run continues
+        if len(row) <= id_col:
+            error_message = f"Skipping line {line_number}: no Id value"
+            print(error_message)
+            logging.error(error_message)
+            continue
+
+        obj_id = row[id_col].strip()
+        print(f"Archival object {obj_id} moving to position {row_number} under {parent_id[0]} {parent_id[1]}")
 
         try:
-            moved_obj = movObj(parent_id[0], parent_id[1], row['Id'], row_number, c)
+            moved_obj = movObj(parent_id[0], parent_id[1], obj_id, row_number, c)
             print(moved_obj["status"])
         
         #Handles errors and logs them to the errors.log file
-        except Exception as e:
+        except (requests.RequestException, KeyError, ValueError) as e:
             error_message = f"Error processing row {row_number}: {e}"
             print(error_message)
             logging.error(error_message)
-            continue
-
-
 
+        row_number += 1
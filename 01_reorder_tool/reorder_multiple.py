@@ -1,8 +1,10 @@
+import argparse
 import requests
 import json
 import os
 import sys
 import csv
+import urllib.parse
 from io import StringIO
 import logging
 
@@ -16,37 +18,86 @@ parent = os.path.dirname(current)
 sys.path.append(parent)
 from config import aspacebaseurl
 from functions import get_record_info
-from functions import movObj
+from functions import get_session_token
+from functions import movObjMult
+from functions import ARCHIVAL_OBJECT_PREFIX
+from functions import accept_children_url
+
+#Optional arguments so the tool can run without prompting
+arg_parser = argparse.ArgumentParser()
+arg_parser.add_argument("--parent-type", choices=["archival_objects", "resources"], help="type of the parent record to reorder into")
+arg_parser.add_argument("--parent-id", type=int, help="id of the parent record to reorder into")
+arg_parser.add_argument("--input-csv", default="01_reorder_tool/in/input.csv", help="path to the edited bulk reorder csv")
+args = arg_parser.parse_args()
 
 #get the current session token
-s = open('current_sess.txt', 'r')
-c = s.read()
+c = get_session_token()
 
-parent_id = get_record_info()
+parent_id = get_record_info(args.parent_type, args.parent_id)
 
 print (f"{parent_id} is being updated.")
 
-objectString = "children[]="
-
 #Open the input csv and get the objects to move and reorder
-with open('01_reorder_tool/in/input.csv', 'r', encoding='utf8') as input_file:
-    csv_reader = list(csv.DictReader(input_file, delimiter=','))  
-    # Convert iterator to list for length access
-    total_rows = len(csv_reader)
-    
-    for index, row in enumerate(csv_reader):
-        objectString += f"/repositories/2/archival_objects/{row['Id']}"
-        if index < total_rows - 1:  # Check if this is not the last row
-            objectString += "&children[]="  # Append only if not the last row
-
-# objectString now has all IDs appended correctly
-print(f"Attempting to move {total_rows} archival objects...")
-      
-try:
-    moved_obj = movObj(parent_id[0], parent_id[1], objectString, 0, c)
-    print(f"{moved_obj['status']} all {total_rows} archival objects.")       
-#Handles errors and logs them to the errors.log file
-except Exception as e:
-    error_message = f"Error processing: {e}"
+#utf-8-sig also reads Excel's "CSV UTF-8" exports, which start with a BOM
+with open(args.input_csv, 'r', encoding='utf-8-sig', newline='') as input_file:
+    csv_reader = csv.reader(input_file, delimiter=',')
+    header = next(csv_reader, [])
+    if 'Id' not in header:
+        sys.exit(f"No Id column found in {args.input_csv}")
+    id_col = header.index('Id')
+    object_ids = []
+    bad_rows = []
+    #Line numbers start at 2 because line 1 is the header
+    for line_number, row in enumerate(csv_reader, start=2):
+        if not row:
+            continue
+        #Rows too short to have an Id are reported with the other invalid ids
+        obj_id = row[id_col].strip() if len(row) > id_col else ""
+        if obj_id.isascii() and obj_id.isdigit():
+            object_ids.append(obj_id)
+        else:
+            bad_rows.append((line_number, obj_id))
+
+#A single invalid id would make the server reject its whole group, so skip them and report them together
+if bad_rows:
+    error_message = f"Skipped {len(bad_rows)} rows with invalid ids (line, id): {bad_rows[:10]}{'...' if len(bad_rows) > 10 else ''}"
     print(error_message)
     logging.error(error_message)
+
+#Nothing to move, so don't send a request without any children
+if not object_ids:
+    sys.exit(f"No valid archival object ids found in {args.input_csv}, no objects were moved.")
+
+total_rows = len(object_ids)
+
+#Position of the first object, the rest of the csv follows it
+position = 0
+
+#Split the ids into groups so each full request url stays under max_url_length
+#Each group is inserted directly after the previous one, so the csv order is kept
+max_url_length = 6000
+#The base url, the "?" and the largest position any group can be sent with count against every request
+base_length = len(accept_children_url(parent_id[0], parent_id[1])) + 1 + len(urllib.parse.urlencode([('position', position + total_rows)]))
+ref_length = len(urllib.parse.urlencode([('children[]', ARCHIVAL_OBJECT_PREFIX)])) + 1
+groups = [[]]
+group_length = base_length
+for obj_id in object_ids:
+    id_length = ref_length + len(obj_id)
+    if groups[-1] and group_length + id_length > max_url_length:
+        groups.append([])
+        group_length = base_length
+    groups[-1].append(obj_id)
+    group_length += id_length
+
+print(f"Attempting to move {total_rows} archival objects in {len(groups)} request(s)...")
+
+for group in groups:
+    try:
+        moved_obj = movObjMult(parent_id[0], parent_id[1], group, position, c)
+        print(f"{moved_obj['status']} {len(group)} archival objects at position {position}.")
+    #Handles errors and logs them to the errors.log file
+    except (requests.RequestException, KeyError, ValueError) as e:
+        error_message = f"Error processing objects at position {position}: {e}"
+        print(error_message)
+        logging.error(error_message)
+    position += len(group)
@@ -1,40 +1,105 @@
+import functools
 import requests
 import json
+import os
+import pathlib
+import sys
 import config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+#Use orjson to parse responses when it is installed, otherwise fall back to the standard library (also used by aspace_session.py)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+#Shared session so repeated calls to the API reuse the same connection
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'aspace_reorder_tool'})
+
+#Retry when the server is rate limiting or briefly unavailable, waiting as long as its Retry-After header asks
+_RETRY = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], allowed_methods=frozenset(["GET", "POST"]), respect_retry_after_header=True, raise_on_status=False)
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=_RETRY)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+#Get the session token from the AS_SESSION_TOKEN environment variable, or from current_sess.txt if it is not set
+def get_session_token():
+    token = os.getenv("AS_SESSION_TOKEN")
+    if token:
+        return token.strip()
+    return pathlib.Path('current_sess.txt').read_text().strip()
+
+#Ref prefix for archival objects, shared with the url length math in reorder_multiple.py so it matches what is sent
+ARCHIVAL_OBJECT_PREFIX = "/repositories/2/archival_objects/"
+
+#Build the accept_children url for a parent record once, as every move under the same parent uses the same one
+_ACCEPT_URL = config.aspacebaseurl + "repositories/2/{parent_type}/{parent_id}/accept_children"
+
+@functools.lru_cache(maxsize=128)
+def accept_children_url(parent_type, parent_id):
+    return _ACCEPT_URL.format(parent_type=parent_type, parent_id=parent_id)
 
 #Move one object at a time
 def movObj(w, x, y, z, sess):
-    url = f"{config.aspacebaseurl}repositories/2/{w}/{x}/accept_children?children[]=/repositories/2/archival_objects/{y}&position={z}"
+    url = accept_children_url(w, x)
+    params = {'children[]': ARCHIVAL_OBJECT_PREFIX + str(y), 'position': z}
     payload = {}
     headers = {
     'X-ArchivesSpace-Session': sess
     }
-    response = requests.request("POST", url, headers=headers, data=payload)
-    res_object = json.loads(response.text)
+    response = _SESSION.post(url, params=params, headers=headers, data=payload)
+    res_object = json_loads(response.content)
     return res_object
 
-#Move multiple objects at once, y will be a string of the form "children[]=/repositories/2/archival_objects/id1&children[]=/repositories/2/archival_objects/id2..."  Position will set the position of id1 and all subsequent children will come after
-def movObjMult(w, x, y, z, sess):
-    url = f"{config.aspacebaseurl}repositories/2/{w}/{x}/accept_children?{y}&position={z}"
+#Move multiple objects at once, ids is a list of archival object ids in the order they should appear.  Position will set the position of the first id and all subsequent children will come after
+def movObjMult(w, x, ids, z, sess):
+    url = accept_children_url(w, x)
+    params = [('children[]', ARCHIVAL_OBJECT_PREFIX + str(i)) for i in ids] + [('position', z)]
     payload = {}
     headers = {
     'X-ArchivesSpace-Session': sess
     }
-    response = requests.request("POST", url, headers=headers, data=payload)
-    res_object = json.loads(response.text)
+    response = _SESSION.post(url, params=params, headers=headers, data=payload)
+    res_object = json_loads(response.content)
     return res_object
 
-#Ask for archival object id input
-def get_record_info():
-    while True:
-        record_type = input("Enter the type of parent record to update (archival_objects/resources): ").strip().lower()
+#Get the parent record type and id from the arguments or the AS_PARENT_TYPE/AS_PARENT_ID environment variables, asking for input only for the ones that are missing
+def get_record_info(record_type=None, record_id=None):
+    if record_type is None:
+        record_type = os.getenv("AS_PARENT_TYPE")
+    if record_id is None:
+        record_id = os.getenv("AS_PARENT_ID")
+
+    if record_type is not None:
+        record_type = str(record_type).strip().lower()
         if record_type not in ["archival_objects", "resources"]:
-            print("Invalid input. Please enter 'archival_objects' or 'resources'.")
-            continue
+            print(f"Invalid parent record type given: {record_type}.")
+            record_type = None
+
+    if record_id is not None:
+        try:
+            record_id = int(record_id)
+        except ValueError:
+            print(f"Invalid parent record id given: {record_id}.")
+            record_id = None
 
-        while True:
+    #Input can also come from a pipe, so only give up when it runs out
+    try:
+        while record_type is None:
+            record_type = input("Enter the type of parent record to update (archival_objects/resources): ").strip().lower()
+            if record_type not in ["archival_objects", "resources"]:
+                print("Invalid input. Please enter 'archival_objects' or 'resources'.")
+                record_type = None
+
+        while record_id is None:
             try:
                 record_id = int(input(f"Enter the ID for the parent {record_type} you want to move or resort into: "))
-                return record_type, record_id
             except ValueError:
-                print("Invalid input. Please enter a valid number.")
\ No newline at end of file
+                print("Invalid input. Please enter a valid number.")
+    except EOFError:
+        sys.exit("No valid parent record given. Use --parent-type and --parent-id or set AS_PARENT_TYPE and AS_PARENT_ID.")
+
+    return record_type, record_id
\ No newline at end of file